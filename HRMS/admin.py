@@ -1,5 +1,23 @@
 from django.contrib import admin
-from .models import Employee, Attendance
+from django.db.models import Count
+from .models import Department, Employee, Attendance
+
+
+@admin.register(Department)
+class DepartmentAdmin(admin.ModelAdmin):
+    """Admin configuration for Department model."""
+    
+    list_display = ('name', 'employee_count', 'created_at')
+    search_fields = ('name',)
+    ordering = ('name',)
+    readonly_fields = ('created_at', 'updated_at')
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(employee_count=Count('employees'))
+    
+    @admin.display(description='Employees', ordering='employee_count')
+    def employee_count(self, obj):
+        return obj.employee_count
 
 
 @admin.register(Employee)
@@ -8,8 +26,10 @@ class EmployeeAdmin(admin.ModelAdmin):
     
     list_display = ('employee_id', 'full_name', 'email', 'department', 'created_at')
     list_filter = ('department', 'created_at')
-    search_fields = ('employee_id', 'full_name', 'email', 'department')
+    search_fields = ('employee_id', 'full_name', 'email', 'department__name')
     ordering = ('full_name',)
+    list_select_related = ('department',)
+    autocomplete_fields = ('department',)
     readonly_fields = ('created_at', 'updated_at')
 
 
@@ -18,7 +38,7 @@ class AttendanceAdmin(admin.ModelAdmin):
     """Admin configuration for Attendance model."""
     
     list_display = ('employee', 'date', 'status', 'created_at')
-    list_filter = ('status', 'date', 'employee')
+    list_filter = ('status', 'date', 'employee__department', 'employee')
     search_fields = ('employee__full_name', 'employee__employee_id')
     date_hierarchy = 'date'
     ordering = ('-date',)
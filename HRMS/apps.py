@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class HrmsConfig(AppConfig):
     name = 'HRMS'
+
+    def ready(self):
+        # Connect the signal handlers that drive the live dashboard feed
+        from . import dashboard  # noqa: F401
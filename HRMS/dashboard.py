@@ -0,0 +1,199 @@
+import logging
+import threading
+from collections import deque
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connections, transaction
+from django.db.models import Count, Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.dateformat import format as format_date
+
+from .models import Employee, Attendance
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_dashboard_stats(today=None):
+    """Summary statistics shown on the dashboard.
+
+    Uses one aggregate query over this week's attendance instead of a
+    separate COUNT per figure.
+    """
+    today = today or date.today()
+    week_start = today - timedelta(days=today.weekday())
+
+    stats = Attendance.objects.filter(
+        date__gte=week_start, date__lte=today
+    ).aggregate(
+        today_present=Count('pk', filter=Q(date=today, status=Attendance.Status.PRESENT)),
+        today_absent=Count('pk', filter=Q(date=today, status=Attendance.Status.ABSENT)),
+        today_total=Count('pk', filter=Q(date=today)),
+        week_present=Count('pk', filter=Q(status=Attendance.Status.PRESENT)),
+        week_absent=Count('pk', filter=Q(status=Attendance.Status.ABSENT)),
+    )
+    stats['total_employees'] = Employee.objects.count()
+
+    # Calculate attendance rate for today
+    if stats['total_employees'] > 0:
+        stats['attendance_rate'] = round(
+            (stats['today_present'] / stats['total_employees']) * 100, 1
+        )
+    else:
+        stats['attendance_rate'] = 0
+    return stats
+
+
+def serialize_attendance(record):
+    """JSON-friendly representation of an attendance row for the dashboard."""
+    return {
+        'id': record.pk,
+        'employee_name': record.employee.full_name,
+        'date': format_date(record.date, 'M d, Y'),
+        'status': record.status_code,
+        'status_display': record.get_status_display(),
+    }
+
+
+class DashboardFeed:
+    """Per-process change feed for live dashboard updates.
+
+    A single background thread recomputes the dashboard statistics while at
+    least one client is subscribed and publishes only what changed. Every
+    connected stream waits on the same published events, so N open
+    dashboards cost one computation per refresh instead of N.
+
+    Each stream still occupies a worker thread, so ``max_subscribers`` caps
+    how many can be open at once in this process (``None`` for no limit).
+    """
+
+    def __init__(self, interval=5, history=50, max_subscribers=None):
+        self.interval = interval
+        self.max_subscribers = max_subscribers
+        self._condition = threading.Condition()
+        self._wake = threading.Event()
+        self._events = deque(maxlen=history)
+        self._version = 0
+        self._stats = None
+        self._last_attendance_pk = None
+        self._subscribers = 0
+        self._thread = None
+
+    def subscribe(self):
+        """Register a client; starts the refresh thread if needed.
+
+        Returns False, without registering, when the process already serves
+        ``max_subscribers`` streams.
+        """
+        with self._condition:
+            if self.max_subscribers is not None and self._subscribers >= self.max_subscribers:
+                return False
+            self._subscribers += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name='dashboard-feed', daemon=True
+                )
+                self._thread.start()
+                self._wake.set()
+            return True
+
+    def unsubscribe(self):
+        with self._condition:
+            self._subscribers = max(self._subscribers - 1, 0)
+
+    def notify(self):
+        """Ask the refresh thread to recompute now instead of at the next tick."""
+        self._wake.set()
+
+    def snapshot(self, timeout=None):
+        """Return (version, stats) once the first refresh has completed."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._stats is not None, timeout)
+            return self._version, self._stats
+
+    def wait(self, since, timeout):
+        """Block until events newer than ``since`` exist or the timeout expires.
+
+        Returns ``(version, payloads)``. If ``since`` has fallen out of the
+        retained history, a single full-stats payload is returned instead.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._version > since, timeout)
+            if self._version <= since:
+                return since, []
+            if not self._events or self._events[0][0] > since + 1:
+                return self._version, [{'stats': self._stats, 'attendance': []}]
+            payloads = [payload for version, payload in self._events if version > since]
+            return self._version, payloads
+
+    def _run(self):
+        try:
+            while True:
+                with self._condition:
+                    if self._subscribers == 0:
+                        # Forget cached figures so the next subscriber never
+                        # receives a snapshot from before the idle period.
+                        self._thread = None
+                        self._stats = None
+                        self._last_attendance_pk = None
+                        return
+                self._wake.wait(self.interval)
+                self._wake.clear()
+                try:
+                    self._refresh()
+                except Exception:
+                    # Keep serving the last known figures; retry on next tick
+                    logger.exception("Dashboard feed refresh failed")
+                finally:
+                    close_old_connections()
+        finally:
+            connections.close_all()
+
+    def _refresh(self):
+        stats = get_dashboard_stats()
+
+        recent = Attendance.objects.select_related('employee').order_by('-pk')
+        if self._last_attendance_pk is None:
+            latest = recent.first()
+            new_records = []
+            self._last_attendance_pk = latest.pk if latest else 0
+        else:
+            new_records = list(recent.filter(pk__gt=self._last_attendance_pk)[:10])
+            if new_records:
+                self._last_attendance_pk = new_records[0].pk
+
+        with self._condition:
+            previous = self._stats
+            self._stats = stats
+            if previous is None:
+                # First refresh only seeds the snapshot; clients get it on connect
+                self._condition.notify_all()
+                return
+
+            changed = {key: value for key, value in stats.items() if previous.get(key) != value}
+            if not changed and not new_records:
+                return
+
+            self._version += 1
+            self._events.append((self._version, {
+                'stats': changed,
+                'attendance': [serialize_attendance(record) for record in reversed(new_records)],
+            }))
+            self._condition.notify_all()
+
+
+feed = DashboardFeed(
+    interval=getattr(settings, 'DASHBOARD_FEED_INTERVAL', 5),
+    max_subscribers=getattr(settings, 'DASHBOARD_STREAM_LIMIT', None),
+)
+
+
+@receiver(post_save, sender=Employee)
+@receiver(post_delete, sender=Employee)
+@receiver(post_save, sender=Attendance)
+@receiver(post_delete, sender=Attendance)
+def notify_dashboard_feed(sender, **kwargs):
+    """Refresh this process's feed as soon as the change is committed."""
+    transaction.on_commit(feed.notify)
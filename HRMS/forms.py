@@ -1,16 +1,30 @@
 from django import forms
 from django.core.validators import EmailValidator
 from django.core.exceptions import ValidationError
-from .models import Employee, Attendance
+from .models import Department, Employee, Attendance
 import re
 
 
 class EmployeeForm(forms.ModelForm):
     """Form for creating and updating Employee records."""
     
+    # Typed as a name; an existing department is reused regardless of case
+    # and surrounding whitespace, otherwise a new one is created on save.
+    department = forms.CharField(
+        max_length=Department._meta.get_field('name').max_length,
+        required=False,
+        widget=forms.TextInput(attrs={
+            'class': 'form-input',
+            'placeholder': 'Enter department (optional)',
+            'id': 'department',
+            'list': 'department_options',
+            'autocomplete': 'off',
+        })
+    )
+    
     class Meta:
         model = Employee
-        fields = ['employee_id', 'full_name', 'email', 'department']
+        fields = ['employee_id', 'full_name', 'email']
         widgets = {
             'employee_id': forms.TextInput(attrs={
                 'class': 'form-input',
@@ -30,14 +44,17 @@ class EmployeeForm(forms.ModelForm):
                 'id': 'email',
                 'autocomplete': 'email',
             }),
-            'department': forms.TextInput(attrs={
-                'class': 'form-input',
-                'placeholder': 'Enter department (optional)',
-                'id': 'department',
-                'autocomplete': 'off',
-            }),
         }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance.department_id and 'department' not in self.initial:
+            self.initial['department'] = self.instance.department.name
+    
+    def department_names(self):
+        """Existing department names, offered as suggestions in the form."""
+        return Department.objects.order_by('name').values_list('name', flat=True)
+    
     def clean_employee_id(self):
         """Validate employee ID format and uniqueness."""
         employee_id = self.cleaned_data.get('employee_id', '').strip()
@@ -81,11 +98,48 @@ class EmployeeForm(forms.ModelForm):
             raise ValidationError("An employee with this email already exists.")
         
         return email
+    
+    def clean_department(self):
+        """Normalize whitespace; an empty value means no department."""
+        return self.cleaned_data.get('department', '').strip()
+    
+    def save(self, commit=True):
+        name = self.cleaned_data['department']
+        if not name:
+            self.instance.department = None
+        elif commit:
+            self.instance.department = Department.objects.get_or_create_by_name(name)
+        else:
+            # Nothing is written with commit=False: link an existing department
+            # now, or create it in save_m2m() once the caller saves.
+            self.instance.department = Department.objects.filter(name__iexact=name).first()
+        
+        instance = super().save(commit=commit)
+        if name and not commit and instance.department is None:
+            save_m2m = self.save_m2m
+            
+            def save_department_and_m2m():
+                instance.department = Department.objects.get_or_create_by_name(name)
+                instance.save(update_fields=['department'])
+                save_m2m()
+            
+            self.save_m2m = save_department_and_m2m
+        return instance
 
 
 class AttendanceForm(forms.ModelForm):
     """Form for marking attendance."""
     
+    # Submitted as the public code ('present'/'absent'), stored as an integer
+    status = forms.TypedChoiceField(
+        choices=Attendance.Status.code_choices(),
+        coerce=Attendance.Status.from_code,
+        initial=Attendance.Status.PRESENT.code,
+        widget=forms.RadioSelect(attrs={
+            'class': 'form-radio',
+        })
+    )
+    
     class Meta:
         model = Attendance
         fields = ['employee', 'date', 'status']
@@ -99,9 +153,6 @@ class AttendanceForm(forms.ModelForm):
                 'type': 'date',
                 'id': 'attendance_date',
             }),
-            'status': forms.RadioSelect(attrs={
-                'class': 'form-radio',
-            }),
         }
     
     def __init__(self, *args, **kwargs):
@@ -132,6 +183,15 @@ class AttendanceForm(forms.ModelForm):
 class AttendanceFilterForm(forms.Form):
     """Form for filtering attendance records."""
     
+    department = forms.ModelChoiceField(
+        queryset=Department.objects.all().order_by('name'),
+        required=False,
+        empty_label="All Departments",
+        widget=forms.Select(attrs={
+            'class': 'form-select filter-select',
+            'id': 'filter_department',
+        })
+    )
     employee = forms.ModelChoiceField(
         queryset=Employee.objects.all().order_by('full_name'),
         required=False,
@@ -158,7 +218,7 @@ class AttendanceFilterForm(forms.Form):
         })
     )
     status = forms.ChoiceField(
-        choices=[('', 'All Statuses'), ('present', 'Present'), ('absent', 'Absent')],
+        choices=[('', 'All Statuses')] + Attendance.Status.code_choices(),
         required=False,
         widget=forms.Select(attrs={
             'class': 'form-select filter-select',
@@ -0,0 +1,166 @@
+import statistics
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.core.paginator import Paginator
+from django.template import RequestContext, engines
+from django.template.engine import Engine
+from django.test import RequestFactory, override_settings
+from django.utils import timezone
+
+from HRMS.models import Department, Employee, Attendance
+from HRMS.views import attendance_rows_version, employee_rows_version
+
+
+UNCACHED_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+LOCMEM = 'django.core.cache.backends.locmem.LocMemCache'
+DUMMY = 'django.core.cache.backends.dummy.DummyCache'
+
+
+class Command(BaseCommand):
+    """Measure list page render time with and without template caching."""
+
+    help = (
+        "Render the employee and attendance list templates for pages of the "
+        "given sizes and report median render times: without caching, with "
+        "the cached loader and a cold fragment cache, and with a warm one. "
+        "Uses in-memory records, so no database rows are needed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            default='25,1000',
+            help='Comma-separated page sizes to render (default: 25,1000).',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=20,
+            help='Renders per measurement; the median is reported (default: 20).',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(size) for size in options['rows'].split(',')]
+        except ValueError:
+            raise CommandError("--rows must be a comma-separated list of integers.")
+        iterations = options['iterations']
+        if iterations < 1:
+            raise CommandError("--iterations must be a positive integer.")
+
+        cached_engine = engines['django'].engine
+        uncached_engine = Engine(
+            dirs=cached_engine.dirs,
+            app_dirs=False,
+            context_processors=cached_engine.context_processors,
+            loaders=UNCACHED_LOADERS,
+            libraries=cached_engine.libraries,
+        )
+
+        self.stdout.write(
+            f"{'page':<22}{'rows':>6}{'before (ms)':>14}{'cold (ms)':>12}"
+            f"{'warm (ms)':>12}{'speedup':>10}"
+        )
+        for size in sizes:
+            for name, template, context in self.pages(size):
+                with override_settings(CACHES=self.caches_setting(DUMMY)):
+                    before = self.measure(uncached_engine, template, context, iterations)
+
+                with override_settings(CACHES=self.caches_setting(LOCMEM)):
+                    fragments = caches['template_fragments']
+                    cold = self.measure(
+                        cached_engine, template, context, iterations, before_each=fragments.clear
+                    )
+                    warm = self.measure(cached_engine, template, context, iterations)
+
+                self.stdout.write(
+                    f"{name:<22}{size:>6}{before:>14.2f}{cold:>12.2f}"
+                    f"{warm:>12.2f}{before / warm:>9.1f}x"
+                )
+
+    def caches_setting(self, fragment_backend):
+        return {
+            'default': {'BACKEND': LOCMEM, 'LOCATION': 'benchmark-default'},
+            'template_fragments': {
+                'BACKEND': fragment_backend,
+                'LOCATION': 'benchmark-fragments',
+                'OPTIONS': {'MAX_ENTRIES': 20000},
+            },
+        }
+
+    def measure(self, engine, template_name, context, iterations, before_each=None):
+        """Median milliseconds to load and render a template."""
+        request = RequestFactory().get('/')
+        request.user = AnonymousUser()
+        request.resolver_match = None
+
+        timings = []
+        for _ in range(iterations + 1):
+            if before_each:
+                before_each()
+            start = time.perf_counter()
+            engine.get_template(template_name).render(RequestContext(request, context))
+            timings.append((time.perf_counter() - start) * 1000)
+        # The first render only warms the loader and fragment caches
+        return statistics.median(timings[1:])
+
+    def pages(self, size):
+        """(label, template, context) for each list page with ``size`` rows."""
+        now = timezone.now()
+        departments = [
+            Department(pk=pk, name=f'Department {pk}', created_at=now, updated_at=now)
+            for pk in range(1, 6)
+        ]
+        employees = [
+            Employee(
+                pk=pk,
+                employee_id=f'EMP{pk:05d}',
+                full_name=f'Employee {pk}',
+                email=f'employee{pk}@example.com',
+                department=departments[pk % len(departments)],
+                created_at=now,
+                updated_at=now,
+            )
+            for pk in range(1, size + 1)
+        ]
+        records = [
+            Attendance(
+                pk=pk,
+                employee=employees[pk - 1],
+                date=date.today() - timedelta(days=pk % 30),
+                status=Attendance.Status.PRESENT if pk % 4 else Attendance.Status.ABSENT,
+                created_at=now,
+            )
+            for pk in range(1, size + 1)
+        ]
+
+        employee_page = Paginator(employees, size).page(1)
+        yield 'employee_list', 'employees/employee_list.html', {
+            'employees': employee_page.object_list,
+            'page_obj': employee_page,
+            'is_paginated': False,
+            'search': '',
+            'department': '',
+            'departments': departments,
+            'total_count': size,
+            'rows_cache_version': employee_rows_version(employee_page.object_list),
+        }
+
+        attendance_page = Paginator(records, size).page(1)
+        yield 'attendance_list', 'attendance/attendance_list.html', {
+            'attendance_records': attendance_page.object_list,
+            'page_obj': attendance_page,
+            'is_paginated': False,
+            'filter_form': None,
+            'total_count': size,
+            'present_count': sum(1 for r in records if r.status == Attendance.Status.PRESENT),
+            'absent_count': sum(1 for r in records if r.status == Attendance.Status.ABSENT),
+            'rows_cache_version': attendance_rows_version(attendance_page.object_list),
+        }
@@ -0,0 +1,118 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from HRMS.models import Employee, Attendance
+
+
+class Command(BaseCommand):
+    """Mark every employee without an attendance record as absent."""
+
+    help = (
+        "Create 'absent' attendance records for employees with no record on "
+        "each date in the given range (defaults to today)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--date',
+            type=date.fromisoformat,
+            help='Single date to close out (YYYY-MM-DD).',
+        )
+        parser.add_argument(
+            '--from',
+            dest='date_from',
+            type=date.fromisoformat,
+            help='First date of the range (YYYY-MM-DD).',
+        )
+        parser.add_argument(
+            '--to',
+            dest='date_to',
+            type=date.fromisoformat,
+            help='Last date of the range, inclusive (YYYY-MM-DD).',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of records inserted per query (default: 1000).',
+        )
+        parser.add_argument(
+            '--skip-weekends',
+            action='store_true',
+            help='Do not mark anyone absent on Saturdays and Sundays.',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report how many records would be created without writing.',
+        )
+
+    def handle(self, *args, **options):
+        date_from, date_to = self.get_date_range(options)
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+
+        verb = 'would be' if options['dry_run'] else 'were'
+        total = 0
+        day = date_from
+        while day <= date_to:
+            if options['skip_weekends'] and day.weekday() >= 5:
+                day += timedelta(days=1)
+                continue
+
+            if options['dry_run']:
+                created = self.get_unmarked(day).count()
+            else:
+                with transaction.atomic():
+                    created = self.mark_day(day, batch_size)
+            total += created
+            self.stdout.write(f"{day}: {created} employee(s) {verb} marked absent")
+            day += timedelta(days=1)
+
+        self.stdout.write(self.style.SUCCESS(f"{total} absent record(s) {verb} created."))
+
+    def get_date_range(self, options):
+        """Resolve --date / --from / --to into an inclusive date range."""
+        single = options['date']
+        date_from = options['date_from']
+        date_to = options['date_to']
+
+        if single and (date_from or date_to):
+            raise CommandError("Use either --date or --from/--to, not both.")
+        if single:
+            return single, single
+
+        today = timezone.localdate()
+        date_from = date_from or date_to or today
+        date_to = date_to or today
+        if date_from > date_to:
+            raise CommandError("--from must not be after --to.")
+        return date_from, date_to
+
+    def get_unmarked(self, day):
+        """Employees who existed on the given day but have no record for it."""
+        return Employee.objects.unmarked_on(day)
+
+    def mark_day(self, day, batch_size):
+        """Insert absent records for one day in chunks; returns rows created."""
+        # Only primary keys are loaded, so even large headcounts stay small
+        # in memory; the list is fixed before any insert touches the table.
+        employee_ids = list(
+            self.get_unmarked(day).order_by('pk').values_list('pk', flat=True)
+        )
+        existing = Attendance.objects.filter(date=day).count()
+
+        for start in range(0, len(employee_ids), batch_size):
+            batch = [
+                Attendance(employee_id=employee_id, date=day, status=Attendance.Status.ABSENT)
+                for employee_id in employee_ids[start:start + batch_size]
+            ]
+            # Rows marked concurrently since the anti-join ran are skipped by
+            # the (employee, date) unique constraint instead of failing.
+            Attendance.objects.bulk_create(batch, ignore_conflicts=True)
+        # Skipped conflicts are not reported by bulk_create, so count the rows
+        return Attendance.objects.filter(date=day).count() - existing
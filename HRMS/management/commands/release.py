@@ -0,0 +1,74 @@
+import time
+from contextlib import contextmanager
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+LOCK_NAME = 'hrms_lite_release'
+
+
+class Command(BaseCommand):
+    """Release-phase tasks that must run once per deploy, not per container."""
+
+    help = (
+        "Apply database migrations while holding a database lock, so that "
+        "concurrent deploys or replicas never run migrate at the same time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--database',
+            default=DEFAULT_DB_ALIAS,
+            help='Database to migrate (default: "default").',
+        )
+        parser.add_argument(
+            '--lock-timeout',
+            type=int,
+            default=300,
+            help='Seconds to wait for another release to finish (default: 300).',
+        )
+
+    def handle(self, *args, **options):
+        database = options['database']
+        started = time.monotonic()
+
+        with self.release_lock(connections[database], options['lock_timeout']):
+            call_command(
+                'migrate',
+                database=database,
+                interactive=False,
+                verbosity=options['verbosity'],
+            )
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(f"Release finished in {elapsed:.1f}s."))
+
+    @contextmanager
+    def release_lock(self, connection, timeout):
+        """Hold a database-wide lock for the duration of the block.
+
+        MySQL uses a named GET_LOCK(); other backends (e.g. SQLite for local
+        development) run without one.
+        """
+        vendor = connection.vendor
+
+        if vendor == 'mysql':
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT GET_LOCK(%s, %s)", [LOCK_NAME, timeout])
+                acquired = cursor.fetchone()[0]
+            if acquired != 1:
+                raise CommandError(
+                    f"Could not acquire the release lock within {timeout}s; "
+                    "another release may still be running."
+                )
+            try:
+                yield
+            finally:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT RELEASE_LOCK(%s)", [LOCK_NAME])
+
+        else:
+            self.stdout.write(f"No release lock support for {vendor}; continuing without one.")
+            yield
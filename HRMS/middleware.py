@@ -0,0 +1,140 @@
+import logging
+import random
+
+from django.conf import settings
+from django.urls import reverse
+
+from .profiling import RequestProfiler, SQL_ENTRY, TEMPLATE_ENTRY
+from .routers import (
+    REPLICA_DB_ALIAS,
+    replica_configured,
+    reset_read_database,
+    use_read_database,
+)
+
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class ReadReplicaMiddleware:
+    """Route read-only views to the replica with read-your-writes stickiness.
+
+    Views opt in by setting ``use_read_replica = True``. After any write
+    request the client gets a short-lived cookie that pins its reads to the
+    primary, so users see their own changes despite replication lag.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.cookie_name = getattr(settings, 'REPLICA_PIN_COOKIE_NAME', 'hrms_pin_primary')
+        self.pin_seconds = getattr(settings, 'REPLICA_PIN_SECONDS', 10)
+
+    def __call__(self, request):
+        request.use_read_replica = False
+        request._read_db_token = None
+        try:
+            response = self.get_response(request)
+        finally:
+            # Template responses are rendered before get_response() returns,
+            # so the read alias covers the whole view including its template.
+            if request._read_db_token is not None:
+                reset_read_database(request._read_db_token)
+
+        if request.method not in SAFE_METHODS and replica_configured():
+            response.set_cookie(
+                self.cookie_name,
+                '1',
+                max_age=self.pin_seconds,
+                httponly=True,
+                samesite='Lax',
+                secure=request.is_secure(),
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, 'view_class', None)
+        if (
+            replica_configured()
+            and request.method in SAFE_METHODS
+            and getattr(view_class, 'use_read_replica', False)
+            and self.cookie_name not in request.COOKIES
+        ):
+            request.use_read_replica = True
+            request._read_db_token = use_read_database(REPLICA_DB_ALIAS)
+        return None
+
+
+class ProfilingMiddleware:
+    """Profile individual requests on demand for staff users.
+
+    A staff user turns it on with the ``X-Profile: 1`` header or the
+    ``?profile=1`` query parameter; PROFILING_SAMPLE_RATE (0.0-1.0) controls
+    what fraction of those requests are actually profiled. Results are
+    stored as RequestProfile rows and shown under /profiles/.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'PROFILING_SAMPLE_RATE', 1.0)
+        self.max_stored = getattr(settings, 'PROFILING_MAX_STORED', 200)
+
+    def __call__(self, request):
+        if not self.should_profile(request) or not RequestProfiler.acquire():
+            return self.get_response(request)
+
+        try:
+            profiler = RequestProfiler()
+            response = profiler.run(self.get_response, request)
+            # A profile that cannot be stored must not turn the real
+            # response into an error
+            try:
+                profile = self.save_profile(request, response, profiler)
+                response['X-Profile-Id'] = str(profile.pk)
+                response['X-Profile-URL'] = reverse('hrms:profile_detail', args=[profile.pk])
+            except Exception:
+                logger.exception("Could not save request profile for %s", request.path)
+        finally:
+            RequestProfiler.release()
+        return response
+
+    def should_profile(self, request):
+        requested = (
+            request.headers.get('X-Profile') == '1'
+            or request.GET.get('profile') == '1'
+        )
+        if not requested or self.sample_rate <= 0:
+            return False
+        user = getattr(request, 'user', None)
+        if user is None or not user.is_staff:
+            return False
+        return random.random() < self.sample_rate
+
+    def save_profile(self, request, response, profiler):
+        from .models import RequestProfile
+
+        match = request.resolver_match
+        sql_ms, sql_queries = profiler.entry_point_time(SQL_ENTRY)
+        template_ms, _ = profiler.entry_point_time(TEMPLATE_ENTRY)
+
+        profile = RequestProfile.objects.create(
+            route=(match.view_name if match else '') or request.path,
+            method=request.method,
+            path=request.get_full_path()[:500],
+            status_code=response.status_code,
+            duration_ms=round(profiler.duration * 1000, 3),
+            sql_ms=sql_ms,
+            sql_queries=sql_queries,
+            template_ms=template_ms,
+            peak_memory=profiler.peak_memory,
+            top_functions=profiler.function_summary(),
+            top_allocations=profiler.allocations,
+            folded_stacks=profiler.folded_stacks(),
+            user=request.user,
+        )
+
+        # Keep only the most recent profiles
+        stale = RequestProfile.objects.values_list('pk', flat=True)[self.max_stored:]
+        RequestProfile.objects.filter(pk__in=list(stale)).delete()
+        return profile
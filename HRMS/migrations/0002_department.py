@@ -0,0 +1,85 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def forwards_departments(apps, schema_editor):
+    """Create one Department per distinct department string and link employees.
+
+    Strings are deduplicated case-insensitively after stripping whitespace; the
+    most common spelling of each group becomes the department name.
+    """
+    Employee = apps.get_model('HRMS', 'Employee')
+    Department = apps.get_model('HRMS', 'Department')
+
+    groups = {}
+    rows = (
+        Employee.objects.exclude(department='')
+        .values('department')
+        .annotate(total=models.Count('id'))
+        .order_by()
+    )
+    for row in rows:
+        raw = row['department']
+        if not raw.strip():
+            continue
+        groups.setdefault(raw.strip().lower(), []).append((row['total'], raw))
+
+    for variants in groups.values():
+        _, name = max((total, raw.strip()) for total, raw in variants)
+        department = Department.objects.create(name=name)
+        Employee.objects.filter(
+            department__in=[raw for _, raw in variants]
+        ).update(department_ref=department)
+
+
+def backwards_departments(apps, schema_editor):
+    """Copy department names back onto the free-text column."""
+    Employee = apps.get_model('HRMS', 'Employee')
+    Department = apps.get_model('HRMS', 'Department')
+
+    for department in Department.objects.all():
+        Employee.objects.filter(department_ref=department).update(department=department.name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HRMS', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Department',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='Department Name')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Department',
+                'verbose_name_plural': 'Departments',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='employee',
+            name='department_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='HRMS.department'),
+        ),
+        migrations.RunPython(forwards_departments, backwards_departments),
+        migrations.RemoveField(
+            model_name='employee',
+            name='department',
+        ),
+        migrations.RenameField(
+            model_name='employee',
+            old_name='department_ref',
+            new_name='department',
+        ),
+        migrations.AlterField(
+            model_name='employee',
+            name='department',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='employees', to='HRMS.department', verbose_name='Department'),
+        ),
+    ]
@@ -0,0 +1,103 @@
+from django.db import migrations, models, transaction
+from django.db.models.functions import Lower, Trim
+
+
+BATCH_SIZE = 5000
+
+# Old string value (lower-cased, trimmed) -> new integer value
+STATUS_VALUES = {
+    'present': 1,
+    'absent': 2,
+}
+
+
+def _normalized_status(queryset):
+    return queryset.annotate(normalized_status=Lower(Trim('status')))
+
+
+def check_statuses(apps, schema_editor):
+    """Refuse to migrate if any status would not map to a known value.
+
+    Runs before the schema changes so a failure leaves the table untouched.
+    """
+    Attendance = apps.get_model('HRMS', 'Attendance')
+    unknown = list(
+        _normalized_status(Attendance.objects)
+        .exclude(normalized_status__in=STATUS_VALUES)
+        .values_list('status', flat=True)
+        .distinct()[:10]
+    )
+    if unknown:
+        raise ValueError(
+            f"Attendance rows have unrecognised status values {unknown!r}; "
+            f"fix them to one of {sorted(STATUS_VALUES)} before migrating."
+        )
+
+
+def _convert_in_batches(apps, source_field, target_field, mapping, normalize=False):
+    """Copy statuses between columns one primary-key range at a time.
+
+    Each batch commits on its own so large tables are never locked by a
+    single long-running UPDATE. With ``normalize``, text values are matched
+    case-insensitively and ignoring surrounding whitespace.
+    """
+    Attendance = apps.get_model('HRMS', 'Attendance')
+    bounds = Attendance.objects.aggregate(low=models.Min('pk'), high=models.Max('pk'))
+    if bounds['low'] is None:
+        return
+
+    for start in range(bounds['low'], bounds['high'] + 1, BATCH_SIZE):
+        with transaction.atomic():
+            batch = Attendance.objects.filter(pk__gte=start, pk__lt=start + BATCH_SIZE)
+            if normalize:
+                batch = _normalized_status(batch)
+                source_field = 'normalized_status'
+            for old, new in mapping.items():
+                batch.filter(**{source_field: old}).update(**{target_field: new})
+
+
+def forwards_status(apps, schema_editor):
+    _convert_in_batches(apps, 'status', 'status_value', STATUS_VALUES, normalize=True)
+
+
+def backwards_status(apps, schema_editor):
+    reverse = {new: old for old, new in STATUS_VALUES.items()}
+    _convert_in_batches(apps, 'status_value', 'status', reverse)
+
+
+class Migration(migrations.Migration):
+
+    # Batches commit individually instead of inside one migration transaction
+    atomic = False
+
+    dependencies = [
+        ('HRMS', '0002_department'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_statuses, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='attendance',
+            name='status_value',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Present'), (2, 'Absent')], default=1),
+        ),
+        migrations.RunPython(forwards_status, backwards_status),
+        migrations.RemoveField(
+            model_name='attendance',
+            name='status',
+        ),
+        migrations.RenameField(
+            model_name='attendance',
+            old_name='status_value',
+            new_name='status',
+        ),
+        migrations.AlterField(
+            model_name='attendance',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Present'), (2, 'Absent')], default=1, verbose_name='Status'),
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['date', 'status'], name='hrms_attendance_date_status'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HRMS', '0003_attendance_status_smallint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RequestProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('route', models.CharField(max_length=200, verbose_name='Route')),
+                ('method', models.CharField(max_length=10)),
+                ('path', models.CharField(max_length=500)),
+                ('status_code', models.PositiveSmallIntegerField()),
+                ('duration_ms', models.FloatField(verbose_name='Duration (ms)')),
+                ('sql_ms', models.FloatField(default=0, verbose_name='SQL time (ms)')),
+                ('sql_queries', models.PositiveIntegerField(default=0, verbose_name='SQL queries')),
+                ('template_ms', models.FloatField(default=0, verbose_name='Template time (ms)')),
+                ('peak_memory', models.PositiveBigIntegerField(default=0, help_text='Peak bytes allocated while handling the request', verbose_name='Peak memory')),
+                ('top_functions', models.JSONField(blank=True, default=list)),
+                ('top_allocations', models.JSONField(blank=True, default=list)),
+                ('folded_stacks', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Requested by')),
+            ],
+            options={
+                'verbose_name': 'Request Profile',
+                'verbose_name_plural': 'Request Profiles',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['route', '-created_at'], name='hrms_profile_route_created')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:22
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HRMS', '0004_requestprofile'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='department',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), name='hrms_department_name_ci_unique', violation_error_message='A department with this name already exists.'),
+        ),
+    ]
@@ -1,5 +1,74 @@
-from django.db import models
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.db.models import Exists, OuterRef
+from django.db.models.functions import Lower
 from django.core.validators import EmailValidator
+from django.utils import timezone
+
+
+class DepartmentQuerySet(models.QuerySet):
+    """Custom queryset for Department lookups."""
+    
+    def get_or_create_by_name(self, name):
+        """Return the department called ``name`` in any letter case, creating it if needed.
+        
+        ``name`` should already be stripped. A department created concurrently
+        under the same name is picked up instead of raising.
+        """
+        department = self.filter(name__iexact=name).first()
+        if department:
+            return department
+        try:
+            with transaction.atomic():
+                return self.create(name=name)
+        except IntegrityError:
+            return self.get(name__iexact=name)
+
+
+class Department(models.Model):
+    """Department model for grouping employees."""
+    
+    name = models.CharField(
+        max_length=100, 
+        unique=True,
+        verbose_name="Department Name"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    objects = DepartmentQuerySet.as_manager()
+    
+    class Meta:
+        ordering = ['name']
+        verbose_name = "Department"
+        verbose_name_plural = "Departments"
+        constraints = [
+            models.UniqueConstraint(
+                Lower('name'),
+                name='hrms_department_name_ci_unique',
+                violation_error_message="A department with this name already exists.",
+            ),
+        ]
+    
+    def __str__(self):
+        return self.name
+
+
+class EmployeeQuerySet(models.QuerySet):
+    """Custom queryset for Employee lookups."""
+    
+    def unmarked_on(self, day):
+        """Employees who existed on the given date but have no record for it.
+        
+        Uses a correlated NOT EXISTS so the database answers it from the
+        (employee, date) unique index instead of loading both tables.
+        Employees added after that day are left out.
+        """
+        next_day = timezone.make_aware(datetime.combine(day + timedelta(days=1), time.min))
+        marked = Attendance.objects.filter(employee=OuterRef('pk'), date=day)
+        return self.filter(~Exists(marked), created_at__lt=next_day)
 
 
 class Employee(models.Model):
@@ -20,15 +89,19 @@ class Employee(models.Model):
         validators=[EmailValidator()],
         verbose_name="Email Address"
     )
-    department = models.CharField(
-        max_length=100, 
-        blank=True, 
-        default="",
+    department = models.ForeignKey(
+        Department,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='employees',
         verbose_name="Department"
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = EmployeeQuerySet.as_manager()
+    
     class Meta:
         ordering = ['full_name']
         verbose_name = "Employee"
@@ -41,10 +114,30 @@ class Employee(models.Model):
 class Attendance(models.Model):
     """Attendance model for tracking employee attendance."""
     
-    STATUS_CHOICES = [
-        ('present', 'Present'),
-        ('absent', 'Absent'),
-    ]
+    class Status(models.IntegerChoices):
+        """Attendance statuses, stored as small integers.
+        
+        Forms, URLs and JSON keep using the lower-case member name
+        ('present', 'absent') as the public code.
+        """
+        PRESENT = 1, 'Present'
+        ABSENT = 2, 'Absent'
+        
+        @property
+        def code(self):
+            return self.name.lower()
+        
+        @classmethod
+        def from_code(cls, code):
+            """Return the status for a public code, or None if it is unknown."""
+            try:
+                return cls[str(code).upper()]
+            except KeyError:
+                return None
+        
+        @classmethod
+        def code_choices(cls):
+            return [(member.code, member.label) for member in cls]
     
     employee = models.ForeignKey(
         Employee, 
@@ -53,10 +146,9 @@ class Attendance(models.Model):
         verbose_name="Employee"
     )
     date = models.DateField(verbose_name="Date")
-    status = models.CharField(
-        max_length=10, 
-        choices=STATUS_CHOICES,
-        default='present',
+    status = models.PositiveSmallIntegerField(
+        choices=Status.choices,
+        default=Status.PRESENT,
         verbose_name="Status"
     )
     created_at = models.DateTimeField(auto_now_add=True)
@@ -66,6 +158,56 @@ class Attendance(models.Model):
         verbose_name = "Attendance"
         verbose_name_plural = "Attendance Records"
         unique_together = ['employee', 'date']  # One attendance record per employee per day
+        indexes = [
+            # Date-range status counts (dashboard, reports) read only this index
+            models.Index(fields=['date', 'status'], name='hrms_attendance_date_status'),
+        ]
     
     def __str__(self):
         return f"{self.employee.full_name} - {self.date} ({self.get_status_display()})"
+    
+    @property
+    def status_code(self):
+        """Public string code for the status, e.g. 'present'."""
+        return self.Status(self.status).code
+
+
+class RequestProfile(models.Model):
+    """cProfile and tracemalloc results for one profiled request."""
+    
+    route = models.CharField(max_length=200, verbose_name="Route")
+    method = models.CharField(max_length=10)
+    path = models.CharField(max_length=500)
+    status_code = models.PositiveSmallIntegerField()
+    duration_ms = models.FloatField(verbose_name="Duration (ms)")
+    sql_ms = models.FloatField(default=0, verbose_name="SQL time (ms)")
+    sql_queries = models.PositiveIntegerField(default=0, verbose_name="SQL queries")
+    template_ms = models.FloatField(default=0, verbose_name="Template time (ms)")
+    peak_memory = models.PositiveBigIntegerField(
+        default=0,
+        verbose_name="Peak memory",
+        help_text="Peak bytes allocated while handling the request"
+    )
+    top_functions = models.JSONField(default=list, blank=True)
+    top_allocations = models.JSONField(default=list, blank=True)
+    folded_stacks = models.TextField(blank=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name="Requested by"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = "Request Profile"
+        verbose_name_plural = "Request Profiles"
+        indexes = [
+            models.Index(fields=['route', '-created_at'], name='hrms_profile_route_created'),
+        ]
+    
+    def __str__(self):
+        return f"{self.method} {self.path} ({self.duration_ms:.0f} ms)"
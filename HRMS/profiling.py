@@ -0,0 +1,170 @@
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+
+from django.db.backends.utils import CursorWrapper
+from django.template.base import Template
+
+
+# Only one request is profiled at a time per process: cProfile and
+# tracemalloc are process-wide and would mix concurrent requests together.
+_profile_lock = threading.Lock()
+
+
+def code_key(func):
+    """The (filename, line, name) key pstats uses for a Python function."""
+    code = func.__code__
+    return (code.co_filename, code.co_firstlineno, code.co_name)
+
+
+# Entry points used for the time breakdown. Matched exactly, since several
+# functions in the same module share a name (Node.render, VariableNode.render).
+SQL_ENTRY = code_key(CursorWrapper._execute)
+TEMPLATE_ENTRY = code_key(Template.render)
+
+
+class RequestProfiler:
+    """Run a callable under cProfile, tracemalloc and a stack sampler."""
+
+    def __init__(self, top_functions=40, top_allocations=20):
+        self.top_functions = top_functions
+        self.top_allocations = top_allocations
+        self.stats = None
+        self.duration = 0
+        self.peak_memory = 0
+        self.allocations = []
+        self.sampler = None
+
+    @staticmethod
+    def acquire():
+        """Return True if this thread may profile now; pair with release()."""
+        return _profile_lock.acquire(blocking=False)
+
+    @staticmethod
+    def release():
+        _profile_lock.release()
+
+    def run(self, func, *args, **kwargs):
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        profiler = cProfile.Profile()
+        self.sampler = StackSampler(threading.get_ident(), sys._getframe())
+
+        start = time.perf_counter()
+        self.sampler.start()
+        profiler.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.disable()
+            self.sampler.stop()
+            self.duration = time.perf_counter() - start
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            self.allocations = self._summarize_allocations(tracemalloc.take_snapshot())
+            if started_tracing:
+                tracemalloc.stop()
+            self.stats = pstats.Stats(profiler)
+
+    def _summarize_allocations(self, snapshot):
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        ])
+        return [
+            {
+                'location': f'{stat.traceback[0].filename}:{stat.traceback[0].lineno}',
+                'size': stat.size,
+                'count': stat.count,
+            }
+            for stat in snapshot.statistics('lineno')[:self.top_allocations]
+        ]
+
+    def function_summary(self):
+        """Top functions by cumulative time, as JSON-friendly dicts."""
+        rows = []
+        for func, (cc, nc, tt, ct, callers) in self.stats.stats.items():
+            rows.append({
+                'function': function_label(func),
+                'calls': nc,
+                'primitive_calls': cc,
+                'tottime': round(tt * 1000, 3),
+                'cumtime': round(ct * 1000, 3),
+            })
+        rows.sort(key=lambda row: row['cumtime'], reverse=True)
+        return rows[:self.top_functions]
+
+    def entry_point_time(self, entry):
+        """Cumulative milliseconds and call count of a function like SQL_ENTRY."""
+        if entry not in self.stats.stats:
+            return 0, 0
+        cc, nc, tt, ct, callers = self.stats.stats[entry]
+        return round(ct * 1000, 3), nc
+
+    def folded_stacks(self):
+        """Sampled call stacks in the "folded" flame graph format.
+
+        Loads in speedscope, flamegraph.pl and similar tools. Values are
+        microseconds of wall time.
+        """
+        return self.sampler.folded() if self.sampler else ''
+
+
+class StackSampler(threading.Thread):
+    """Periodically record the call stack of one thread.
+
+    cProfile only keeps caller/callee pairs, which cannot be turned back
+    into full stacks, so flame graphs come from sampling instead. Frames
+    outside ``root_frame`` (server and middleware above the profiler) are
+    left out.
+    """
+
+    def __init__(self, thread_id, root_frame, interval=0.001):
+        super().__init__(name='request-profiler-sampler', daemon=True)
+        self.thread_id = thread_id
+        self.root_frame = root_frame
+        self.interval = interval
+        self.samples = defaultdict(float)
+        self._stop_event = threading.Event()
+
+    def run(self):
+        last = time.perf_counter()
+        while not self._stop_event.wait(self.interval):
+            # The GIL makes real intervals uneven, so weight each sample by
+            # the time since the previous one rather than by the nominal rate.
+            now = time.perf_counter()
+            elapsed, last = now - last, now
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None and frame is not self.root_frame:
+                code = frame.f_code
+                label = f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})'
+                stack.append(label.replace(';', ':'))
+                frame = frame.f_back
+            if stack:
+                self.samples[';'.join(reversed(stack))] += elapsed
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def folded(self):
+        return '\n'.join(
+            f'{stack} {round(seconds * 1_000_000)}'
+            for stack, seconds in sorted(self.samples.items())
+        )
+
+
+def function_label(func):
+    """Readable name for a pstats function key (filename, line, name)."""
+    filename, line, name = func
+    if filename == '~':
+        return name
+    return f'{name} ({filename}:{line})'
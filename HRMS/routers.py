@@ -0,0 +1,48 @@
+from contextvars import ContextVar
+
+from django.conf import settings
+
+
+REPLICA_DB_ALIAS = 'replica'
+
+# Database alias that HRMS reads should use for the current request. It is
+# set by ReadReplicaMiddleware and stays None (primary) everywhere else.
+_read_db_alias = ContextVar('hrms_read_db_alias', default=None)
+
+
+def replica_configured():
+    """Return True when a read replica database is defined in settings."""
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+def use_read_database(alias):
+    """Route HRMS reads to the given alias; returns a token for reset."""
+    return _read_db_alias.set(alias)
+
+
+def reset_read_database(token):
+    """Restore the read alias that was active before use_read_database()."""
+    _read_db_alias.reset(token)
+
+
+class ReplicaRouter:
+    """Send HRMS reads to the replica when the current request allows it.
+
+    Writes, migrations and every other app (auth, sessions, admin) always
+    use the primary database.
+    """
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label != 'HRMS':
+            return None
+        return _read_db_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data, so relations across them are fine
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == 'default'
@@ -17,6 +17,7 @@ document.addEventListener('DOMContentLoaded', function() {
     initializeSearch();
     initializeModals();
     initializeFormValidation();
+    initializeDashboardStream();
 });
 
 // ============================================
@@ -257,6 +258,88 @@ function clearFieldError(field) {
     }
 }
 
+// ============================================
+// Live Dashboard (Server-Sent Events)
+// ============================================
+function initializeDashboardStream() {
+    const dashboard = document.querySelector('.dashboard[data-stream-url]');
+    if (!dashboard || typeof EventSource === 'undefined') return;
+    
+    let source = null;
+    let retryDelay = 5000;
+    const maxRetryDelay = 300000;
+    
+    function connect() {
+        source = new EventSource(dashboard.dataset.streamUrl);
+        
+        source.addEventListener('open', function() {
+            retryDelay = 5000;
+        });
+        
+        source.addEventListener('dashboard', function(e) {
+            const data = JSON.parse(e.data);
+            
+            Object.entries(data.stats || {}).forEach(([key, value]) => {
+                dashboard.querySelectorAll(`[data-stat="${key}"]`).forEach(el => {
+                    el.textContent = value;
+                });
+            });
+            
+            (data.attendance || []).forEach(prependRecentAttendance);
+        });
+        
+        // A 503 (all live slots in use) closes the stream for good. Try the
+        // stream again with exponential backoff; the page keeps showing the
+        // figures it already has in the meantime.
+        source.addEventListener('error', function() {
+            if (source.readyState === EventSource.CLOSED) {
+                setTimeout(connect, retryDelay);
+                retryDelay = Math.min(retryDelay * 2, maxRetryDelay);
+            }
+        });
+    }
+    
+    connect();
+    
+    // Stop streaming when the tab is closed or navigated away from
+    window.addEventListener('beforeunload', () => source.close());
+}
+
+function prependRecentAttendance(record) {
+    const list = document.getElementById('recentAttendance');
+    if (!list || list.querySelector(`[data-id="${record.id}"]`)) return;
+    
+    const item = document.createElement('li');
+    item.className = 'attendance-item';
+    item.dataset.id = record.id;
+    
+    const employee = document.createElement('div');
+    employee.className = 'attendance-employee';
+    const avatar = document.createElement('div');
+    avatar.className = 'employee-avatar small';
+    avatar.textContent = record.employee_name.charAt(0).toUpperCase();
+    const name = document.createElement('span');
+    name.className = 'employee-name';
+    name.textContent = record.employee_name;
+    employee.append(avatar, name);
+    
+    const date = document.createElement('span');
+    date.className = 'attendance-date';
+    date.textContent = record.date;
+    
+    const badge = document.createElement('span');
+    badge.className = `status-badge ${record.status === 'present' ? 'status-present' : 'status-absent'}`;
+    badge.textContent = record.status_display;
+    
+    item.append(employee, date, badge);
+    list.prepend(item);
+    
+    // Keep the list at the same length as the server-rendered one
+    while (list.children.length > 10) {
+        list.lastElementChild.remove();
+    }
+}
+
 // ============================================
 // Toast Notifications
 // ============================================
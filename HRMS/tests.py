@@ -1,3 +1,678 @@
-from django.test import TestCase
+from datetime import date, datetime, timedelta
+from io import StringIO
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, OperationalError, connections
+from django.db.models import QuerySet
+from django.http import HttpResponse
+from django.test import (
+    RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings,
+)
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .dashboard import DashboardFeed, feed
+from .management.commands.release import Command as ReleaseCommand
+from .forms import AttendanceForm, AttendanceFilterForm, EmployeeForm
+from .middleware import ProfilingMiddleware, ReadReplicaMiddleware
+from .models import Department, Employee, Attendance, RequestProfile
+from .routers import REPLICA_DB_ALIAS, ReplicaRouter, replica_configured
+from .views import EmployeeCreateView, EmployeeListView
+
+
+# Read-replica views may query the replica alias when REPLICA_DATABASE_URL is set
+READ_DATABASES = {'default', REPLICA_DB_ALIAS} if replica_configured() else {'default'}
+
+
+class PrimaryReadTestCase(TestCase):
+    """TestCase for pages that are routed to the read replica.
+
+    In tests the replica is a mirror on its own connection. It cannot see
+    rows created inside the test transaction, and on SQLite a second open
+    transaction locks the shared database. Reads are therefore pinned to the
+    primary with the cookie a write would set; ReadReplicaEndToEndTests
+    covers the replica itself.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.client.cookies['hrms_pin_primary'] = '1'
+
+
+class EmployeeFormDepartmentTests(TestCase):
+    """Departments are entered by name on the employee form."""
+
+    def setUp(self):
+        self.sales = Department.objects.create(name='Sales')
+
+    def post(self, department):
+        return self.client.post(reverse('hrms:employee_add'), {
+            'employee_id': 'emp001',
+            'full_name': 'Alice',
+            'email': 'alice@example.com',
+            'department': department,
+        })
+
+    def test_existing_department_reused(self):
+        response = self.post('  sALES ')
+        self.assertRedirects(response, reverse('hrms:employee_list'))
+        self.assertEqual(Employee.objects.get().department, self.sales)
+        self.assertEqual(Department.objects.count(), 1)
+
+    def test_new_department_created(self):
+        self.post(' Marketing ')
+        self.assertEqual(Employee.objects.get().department.name, 'Marketing')
+
+    def test_blank_department(self):
+        self.post('  ')
+        self.assertIsNone(Employee.objects.get().department)
+
+    def test_invalid_form_creates_nothing(self):
+        self.post('Marketing')
+        response = self.client.post(reverse('hrms:employee_add'), {
+            'employee_id': 'emp002',
+            'full_name': 'Bob',
+            'email': 'alice@example.com',
+            'department': 'Support',
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Department.objects.filter(name='Support').exists())
+
+    def test_commit_false_creates_department_on_save_m2m(self):
+        form = EmployeeForm(data={
+            'employee_id': 'emp001',
+            'full_name': 'Alice',
+            'email': 'alice@example.com',
+            'department': 'Marketing',
+        })
+        self.assertTrue(form.is_valid(), form.errors)
+        employee = form.save(commit=False)
+        self.assertFalse(Department.objects.filter(name='Marketing').exists())
+
+        employee.save()
+        form.save_m2m()
+        employee.refresh_from_db()
+        self.assertEqual(employee.department.name, 'Marketing')
+
+    def test_concurrently_created_department_reused(self):
+        # Another request creates "sales" between our lookup and our insert
+        with mock.patch.object(QuerySet, 'first', return_value=None):
+            department = Department.objects.get_or_create_by_name('SALES')
+        self.assertEqual(department, self.sales)
+
+    def test_case_variant_rejected(self):
+        with self.assertRaises(ValidationError):
+            Department(name='sales').full_clean()
+
+    def test_initial_is_department_name(self):
+        employee = Employee.objects.create(
+            employee_id='EMP001', full_name='Alice', email='alice@example.com', department=self.sales
+        )
+        self.assertEqual(EmployeeForm(instance=employee)['department'].value(), 'Sales')
+
+
+class AttendanceStatusTests(PrimaryReadTestCase):
+    """Public status codes ('present'/'absent') over integer storage."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice = Employee.objects.create(
+            employee_id='EMP001', full_name='Alice', email='alice@example.com'
+        )
+        cls.bob = Employee.objects.create(
+            employee_id='EMP002', full_name='Bob', email='bob@example.com'
+        )
+
+    def test_from_code_round_trips(self):
+        for status in Attendance.Status:
+            self.assertEqual(Attendance.Status.from_code(status.code), status)
+
+    def test_from_code_unknown(self):
+        self.assertIsNone(Attendance.Status.from_code('late'))
+        self.assertIsNone(Attendance.Status.from_code(''))
+
+    def test_code_choices(self):
+        self.assertEqual(
+            Attendance.Status.code_choices(),
+            [('present', 'Present'), ('absent', 'Absent')],
+        )
+
+    def test_form_accepts_codes(self):
+        for code, status in [('present', Attendance.Status.PRESENT), ('absent', Attendance.Status.ABSENT)]:
+            form = AttendanceForm(data={
+                'employee': self.alice.pk,
+                'date': date(2026, 2, 2 + status),
+                'status': code,
+            })
+            self.assertTrue(form.is_valid(), form.errors)
+            record = form.save()
+            record.refresh_from_db()
+            self.assertEqual(record.status, status)
+            self.assertEqual(record.status_code, code)
+
+    def test_form_rejects_unknown_code(self):
+        form = AttendanceForm(data={
+            'employee': self.alice.pk,
+            'date': date(2026, 2, 2),
+            'status': '1',
+        })
+        self.assertFalse(form.is_valid())
+        self.assertIn('status', form.errors)
+
+    def test_filter_form_accepts_codes(self):
+        for code in ['', 'present', 'absent']:
+            self.assertTrue(AttendanceFilterForm(data={'status': code}).is_valid())
+        self.assertFalse(AttendanceFilterForm(data={'status': 'late'}).is_valid())
+
+    def test_list_filters_by_code(self):
+        Attendance.objects.create(employee=self.alice, date=date(2026, 2, 2), status=Attendance.Status.PRESENT)
+        Attendance.objects.create(employee=self.bob, date=date(2026, 2, 2), status=Attendance.Status.ABSENT)
+
+        response = self.client.get(reverse('hrms:attendance_list'), {'status': 'absent'})
+        self.assertEqual(
+            [record.employee for record in response.context['attendance_records']],
+            [self.bob],
+        )
+
+        response = self.client.get(reverse('hrms:attendance_list'), {'status': 'late'})
+        self.assertEqual(list(response.context['attendance_records']), [])
+
+
+class UnmarkedEmployeesTests(PrimaryReadTestCase):
+    """EmployeeQuerySet.unmarked_on() and the mark_absent command."""
+
+    # Friday 6 Feb 2026 to Monday 9 Feb 2026
+    FRIDAY = date(2026, 2, 6)
+    SATURDAY = date(2026, 2, 7)
+    SUNDAY = date(2026, 2, 8)
+    MONDAY = date(2026, 2, 9)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice = Employee.objects.create(
+            employee_id='EMP001', full_name='Alice', email='alice@example.com'
+        )
+        cls.bob = Employee.objects.create(
+            employee_id='EMP002', full_name='Bob', email='bob@example.com'
+        )
+        cls.carol = Employee.objects.create(
+            employee_id='EMP003', full_name='Carol', email='carol@example.com'
+        )
+        Employee.objects.update(created_at=timezone.make_aware(datetime(2026, 1, 1)))
+        # Carol joins on Monday
+        Employee.objects.filter(pk=cls.carol.pk).update(
+            created_at=timezone.make_aware(datetime(2026, 2, 9, 12))
+        )
+        Attendance.objects.create(employee=cls.alice, date=cls.FRIDAY, status=Attendance.Status.PRESENT)
+
+    def mark_absent(self, *args):
+        call_command('mark_absent', *args, stdout=StringIO())
+
+    def test_unmarked_on(self):
+        self.assertQuerySetEqual(
+            Employee.objects.unmarked_on(self.FRIDAY), [self.bob], ordered=False
+        )
+        self.assertQuerySetEqual(
+            Employee.objects.unmarked_on(self.MONDAY), [self.alice, self.bob, self.carol], ordered=False
+        )
+
+    def test_page_matches_command(self):
+        response = self.client.get(reverse('hrms:attendance_unmarked'), {'date': '2026-02-06'})
+        self.assertEqual(response.context['unmarked_count'], 1)
+
+        self.mark_absent('--date', '2026-02-06')
+        response = self.client.get(reverse('hrms:attendance_unmarked'), {'date': '2026-02-06'})
+        self.assertEqual(response.context['unmarked_count'], 0)
+
+    def test_mark_absent(self):
+        self.mark_absent('--from', '2026-02-06', '--to', '2026-02-09')
+
+        self.assertEqual(
+            Attendance.objects.get(employee=self.alice, date=self.FRIDAY).status,
+            Attendance.Status.PRESENT,
+        )
+        self.assertEqual(
+            Attendance.objects.get(employee=self.bob, date=self.FRIDAY).status,
+            Attendance.Status.ABSENT,
+        )
+        # Carol was not employed before Monday
+        self.assertEqual(
+            list(Attendance.objects.filter(employee=self.carol).values_list('date', flat=True)),
+            [self.MONDAY],
+        )
+        self.assertEqual(Attendance.objects.count(), 1 + 1 + 2 + 2 + 3)
+
+    def test_mark_absent_is_idempotent(self):
+        self.mark_absent('--from', '2026-02-06', '--to', '2026-02-09')
+        count = Attendance.objects.count()
+
+        self.mark_absent('--from', '2026-02-06', '--to', '2026-02-09')
+        self.assertEqual(Attendance.objects.count(), count)
+
+    def test_mark_absent_skip_weekends(self):
+        self.mark_absent('--from', '2026-02-06', '--to', '2026-02-09', '--skip-weekends')
+
+        self.assertFalse(Attendance.objects.filter(date__in=[self.SATURDAY, self.SUNDAY]).exists())
+        self.assertEqual(Attendance.objects.filter(date=self.FRIDAY).count(), 2)
+        self.assertEqual(Attendance.objects.filter(date=self.MONDAY).count(), 3)
+
+    def test_mark_absent_counts_only_created_rows(self):
+        # Alice is marked between the anti-join and the insert
+        out = StringIO()
+        with mock.patch(
+            'HRMS.management.commands.mark_absent.Command.get_unmarked',
+            return_value=Employee.objects.filter(pk__in=[self.alice.pk, self.bob.pk]),
+        ):
+            call_command('mark_absent', '--date', '2026-02-06', stdout=out)
+
+        self.assertIn('2026-02-06: 1 employee(s) were marked absent', out.getvalue())
+        self.assertIn('1 absent record(s) were created.', out.getvalue())
+
+    @override_settings(TIME_ZONE='Asia/Kolkata')
+    def test_page_defaults_to_local_date(self):
+        # 02:00 in Kolkata is still the previous day in UTC
+        now = timezone.make_aware(datetime(2026, 2, 9, 2), timezone.get_fixed_timezone(330))
+        with mock.patch('django.utils.timezone.now', return_value=now):
+            response = self.client.get(reverse('hrms:attendance_unmarked'))
+        self.assertEqual(response.context['selected_date'], self.MONDAY)
+
+    def test_mark_absent_dry_run(self):
+        self.mark_absent('--from', '2026-02-06', '--to', '2026-02-09', '--dry-run')
+        self.assertEqual(Attendance.objects.count(), 1)
+
+
+@mock.patch('HRMS.middleware.replica_configured', return_value=True)
+class ReadReplicaRoutingTests(SimpleTestCase):
+    """ReadReplicaMiddleware and ReplicaRouter choose the read database."""
+
+    def setUp(self):
+        self.router = ReplicaRouter()
+        self.factory = RequestFactory()
+
+    def route(self, request, view):
+        """Run a request through the middleware; returns (read alias, response)."""
+        seen = {}
+
+        def get_response(request):
+            middleware.process_view(request, view, (), {})
+            seen['employee'] = self.router.db_for_read(Employee)
+            seen['user'] = self.router.db_for_read(User)
+            return HttpResponse()
+
+        middleware = ReadReplicaMiddleware(get_response)
+        response = middleware(request)
+        # The alias never outlives the request
+        self.assertIsNone(self.router.db_for_read(Employee))
+        return seen, response
+
+    def test_get_without_pin_reads_replica(self, replica_configured):
+        seen, response = self.route(self.factory.get('/employees/'), EmployeeListView.as_view())
+        self.assertEqual(seen['employee'], 'replica')
+        # Other apps (auth, sessions) always stay on the primary
+        self.assertIsNone(seen['user'])
+        self.assertNotIn('hrms_pin_primary', response.cookies)
+
+    def test_pin_cookie_reads_primary(self, replica_configured):
+        request = self.factory.get('/employees/')
+        request.COOKIES['hrms_pin_primary'] = '1'
+        seen, response = self.route(request, EmployeeListView.as_view())
+        self.assertIsNone(seen['employee'])
+
+    def test_view_without_opt_in_reads_primary(self, replica_configured):
+        seen, response = self.route(self.factory.get('/employees/add/'), EmployeeCreateView.as_view())
+        self.assertIsNone(seen['employee'])
+
+    def test_write_sets_pin_cookie(self, replica_configured):
+        seen, response = self.route(self.factory.post('/employees/add/'), EmployeeCreateView.as_view())
+        self.assertIsNone(seen['employee'])
+        self.assertEqual(response.cookies['hrms_pin_primary'].value, '1')
+        self.assertEqual(self.router.db_for_write(Employee), 'default')
+
+    def test_no_replica_configured(self, replica_configured):
+        replica_configured.return_value = False
+        seen, response = self.route(self.factory.get('/employees/'), EmployeeListView.as_view())
+        self.assertIsNone(seen['employee'])
+        self.assertNotIn('hrms_pin_primary', response.cookies)
+
+
+@skipUnless(replica_configured(), "set REPLICA_DATABASE_URL to run against a replica")
+class ReadReplicaEndToEndTests(TransactionTestCase):
+    """Real requests against a configured replica (REPLICA_DATABASE_URL).
+
+    Rows are committed so the replica connection, a test mirror of the
+    primary, can read them.
+    """
+
+    databases = READ_DATABASES
+
+    def setUp(self):
+        Employee.objects.create(employee_id='EMP001', full_name='Alice', email='alice@example.com')
+
+    def get_employee_list(self):
+        with CaptureQueriesContext(connections[REPLICA_DB_ALIAS]) as replica_queries:
+            response = self.client.get(reverse('hrms:employee_list'))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Alice')
+        return replica_queries
+
+    def test_list_reads_replica(self):
+        self.assertTrue(any('HRMS_employee' in query['sql'] for query in self.get_employee_list()))
+
+    def test_write_pins_reads_to_primary(self):
+        response = self.client.post(reverse('hrms:employee_add'), {
+            'employee_id': 'EMP002',
+            'full_name': 'Bob',
+            'email': 'bob@example.com',
+        })
+        self.assertRedirects(response, reverse('hrms:employee_list'), fetch_redirect_response=False)
+        self.assertIn('hrms_pin_primary', self.client.cookies)
+        self.assertEqual(len(self.get_employee_list()), 0)
+
+
+class DashboardFeedTests(TestCase):
+    """Change detection and fan-out in DashboardFeed."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice = Employee.objects.create(
+            employee_id='EMP001', full_name='Alice', email='alice@example.com'
+        )
+        cls.bob = Employee.objects.create(
+            employee_id='EMP002', full_name='Bob', email='bob@example.com'
+        )
+
+    def mark(self, employee, status=Attendance.Status.PRESENT):
+        return Attendance.objects.create(employee=employee, date=date.today(), status=status)
+
+    def test_first_refresh_only_seeds(self):
+        dashboard = DashboardFeed()
+        dashboard._refresh()
+
+        version, stats = dashboard.snapshot(timeout=0)
+        self.assertEqual(version, 0)
+        self.assertEqual(stats['total_employees'], 2)
+        self.assertEqual(dashboard.wait(0, timeout=0), (0, []))
+
+    def test_refresh_publishes_only_changes(self):
+        dashboard = DashboardFeed()
+        dashboard._refresh()
+        record = self.mark(self.alice)
+        dashboard._refresh()
+
+        version, payloads = dashboard.wait(0, timeout=0)
+        self.assertEqual(version, 1)
+        self.assertEqual(len(payloads), 1)
+        self.assertEqual(payloads[0]['stats'], {
+            'today_present': 1,
+            'today_total': 1,
+            'week_present': 1,
+            'attendance_rate': 50.0,
+        })
+        self.assertEqual([row['id'] for row in payloads[0]['attendance']], [record.pk])
+
+        # Nothing changed: no new version
+        dashboard._refresh()
+        self.assertEqual(dashboard.wait(1, timeout=0), (1, []))
+
+    def test_wait_falls_back_to_full_stats(self):
+        dashboard = DashboardFeed(history=1)
+        dashboard._refresh()
+        self.mark(self.alice)
+        dashboard._refresh()
+        self.mark(self.bob, Attendance.Status.ABSENT)
+        dashboard._refresh()
+
+        # Version 1 has fallen out of the one-event history
+        version, payloads = dashboard.wait(0, timeout=0)
+        self.assertEqual(version, 2)
+        self.assertEqual(payloads, [{'stats': dashboard.snapshot()[1], 'attendance': []}])
+
+        version, payloads = dashboard.wait(1, timeout=0)
+        self.assertEqual(payloads[0]['stats']['today_absent'], 1)
+
+    @mock.patch.object(DashboardFeed, '_run')
+    def test_subscriber_limit(self, run):
+        dashboard = DashboardFeed(max_subscribers=2)
+        self.assertTrue(dashboard.subscribe())
+        self.assertTrue(dashboard.subscribe())
+        self.assertFalse(dashboard.subscribe())
+
+        dashboard.unsubscribe()
+        self.assertTrue(dashboard.subscribe())
+
+    @mock.patch('HRMS.dashboard.connections')
+    def test_idle_feed_forgets_state(self, connections):
+        dashboard = DashboardFeed()
+        dashboard._refresh()
+        self.assertIsNotNone(dashboard._stats)
+
+        # No subscribers: the refresh loop exits at once and resets
+        dashboard._run()
+        self.assertIsNone(dashboard._stats)
+        self.assertIsNone(dashboard._last_attendance_pk)
+        self.assertIsNone(dashboard._thread)
+
+    @mock.patch.object(DashboardFeed, '_run')
+    def test_stream_view_limit(self, run):
+        with mock.patch.object(feed, 'max_subscribers', 0):
+            response = self.client.get(reverse('hrms:dashboard_stream'))
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '60')
+
+        response = self.client.get(reverse('hrms:dashboard_stream'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(feed._subscribers, 1)
+        # Closing before any event is sent still releases the slot
+        response.close()
+        self.assertEqual(feed._subscribers, 0)
+
+
+class ProfilingMiddlewareTests(PrimaryReadTestCase):
+    """On-demand request profiling for staff users."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user('staff', password='x', is_staff=True)
+        cls.user = User.objects.create_user('user', password='x')
+        Employee.objects.create(employee_id='EMP001', full_name='Alice', email='alice@example.com')
+
+    def setUp(self):
+        super().setUp()
+        self.factory = RequestFactory()
+
+    def should_profile(self, user, path='/employees/', **headers):
+        request = self.factory.get(path, headers=headers)
+        request.user = user
+        return ProfilingMiddleware(lambda request: HttpResponse()).should_profile(request)
+
+    def test_staff_header_or_query_param(self):
+        self.assertTrue(self.should_profile(self.staff, X_Profile='1'))
+        self.assertTrue(self.should_profile(self.staff, '/employees/?profile=1'))
+        self.assertFalse(self.should_profile(self.staff))
+        self.assertFalse(self.should_profile(self.staff, '/employees/?profile=0', X_Profile='0'))
+
+    def test_non_staff_never_profiled(self):
+        self.assertFalse(self.should_profile(self.user, '/employees/?profile=1', X_Profile='1'))
+        self.assertFalse(self.should_profile(AnonymousUser(), '/employees/?profile=1', X_Profile='1'))
+
+    @override_settings(PROFILING_SAMPLE_RATE=0)
+    def test_sample_rate_zero_disables(self):
+        self.assertFalse(self.should_profile(self.staff, X_Profile='1'))
+
+    @override_settings(PROFILING_SAMPLE_RATE=0.5)
+    def test_sample_rate(self):
+        with mock.patch('HRMS.middleware.random.random', return_value=0.4):
+            self.assertTrue(self.should_profile(self.staff, X_Profile='1'))
+        with mock.patch('HRMS.middleware.random.random', return_value=0.6):
+            self.assertFalse(self.should_profile(self.staff, X_Profile='1'))
+
+    def test_profiled_request(self):
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse('hrms:employee_list'), {'profile': '1'})
+
+        self.assertEqual(response.status_code, 200)
+        profile = RequestProfile.objects.get(pk=response['X-Profile-Id'])
+        self.assertEqual(response['X-Profile-URL'], reverse('hrms:profile_detail', args=[profile.pk]))
+        self.assertEqual(profile.route, 'hrms:employee_list')
+        self.assertGreater(profile.sql_queries, 0)
+        self.assertGreater(profile.template_ms, 0)
+        self.assertLessEqual(profile.template_ms, profile.duration_ms)
+
+    @override_settings(PROFILING_MAX_STORED=2)
+    def test_pruning_keeps_newest(self):
+        old = timezone.now() - timedelta(days=1)
+        for minutes in range(3):
+            stale = RequestProfile.objects.create(
+                route='old', method='GET', path='/', status_code=200, duration_ms=1
+            )
+            RequestProfile.objects.filter(pk=stale.pk).update(created_at=old + timedelta(minutes=minutes))
+        newest_old = stale.pk
+
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse('hrms:employee_list'), {'profile': '1'})
+
+        self.assertEqual(
+            set(RequestProfile.objects.values_list('pk', flat=True)),
+            {int(response['X-Profile-Id']), newest_old},
+        )
+
+    def test_save_failure_keeps_response(self):
+        self.client.force_login(self.staff)
+        with mock.patch.object(ProfilingMiddleware, 'save_profile', side_effect=DatabaseError):
+            with self.assertLogs('HRMS.middleware', 'ERROR'):
+                response = self.client.get(reverse('hrms:employee_list'), {'profile': '1'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Alice')
+        self.assertNotIn('X-Profile-Id', response)
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'template_fragments': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'hrms-tests-fragments',
+    },
+})
+class ListFragmentCacheTests(PrimaryReadTestCase):
+    """Cached list rows are re-rendered when the data they show changes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.sales = Department.objects.create(name='Sales')
+        cls.alice = Employee.objects.create(
+            employee_id='EMP001', full_name='Alice', email='alice@example.com', department=cls.sales
+        )
+        cls.record = Attendance.objects.create(
+            employee=cls.alice, date=date(2026, 2, 6), status=Attendance.Status.PRESENT
+        )
+
+    def setUp(self):
+        super().setUp()
+        caches['template_fragments'].clear()
+
+    def get_employees(self):
+        return self.client.get(reverse('hrms:employee_list')).content.decode()
+
+    def get_attendance(self):
+        return self.client.get(reverse('hrms:attendance_list')).content.decode()
+
+    def test_rows_are_cached(self):
+        self.get_employees()
+        # A queryset update leaves updated_at alone, so the cached row is served
+        Employee.objects.filter(pk=self.alice.pk).update(full_name='Alicia')
+        self.assertNotIn('Alicia', self.get_employees())
+
+    def test_employee_edit_invalidates(self):
+        self.assertIn('Alice', self.get_employees())
+        self.alice.full_name = 'Alicia'
+        self.alice.save()
+
+        self.assertIn('Alicia', self.get_employees())
+        self.assertIn('Alicia', self.get_attendance())
+
+    def test_department_rename_invalidates(self):
+        self.assertIn('<span class="department-badge">Sales</span>', self.get_employees())
+        self.sales.name = 'Revenue'
+        self.sales.save()
+
+        self.assertIn('<span class="department-badge">Revenue</span>', self.get_employees())
+
+    def test_attendance_status_change_invalidates(self):
+        self.assertEqual(self.get_attendance().count('status-badge status-present'), 1)
+        self.record.status = Attendance.Status.ABSENT
+        self.record.save()
+
+        html = self.get_attendance()
+        self.assertEqual(html.count('status-badge status-present'), 0)
+        self.assertEqual(html.count('status-badge status-absent'), 1)
+
+
+class HealthCheckTests(TestCase):
+    """Liveness and readiness probes."""
+
+    def setUp(self):
+        patcher = mock.patch('HRMS.views._migrations_applied', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_healthz(self):
+        response = self.client.get('/healthz')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'status': 'ok'})
+
+    def test_readyz_when_migrated(self):
+        response = self.client.get('/readyz')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'status': 'ok'})
+
+    def test_readyz_with_pending_migrations(self):
+        with mock.patch('HRMS.views.MigrationExecutor.migration_plan', return_value=[(mock.Mock(), False)]):
+            response = self.client.get('/readyz')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()['reason'], 'pending migrations')
+
+        # Ready again once the migrations have been applied
+        self.assertEqual(self.client.get('/readyz').status_code, 200)
+
+    def test_readyz_database_unreachable(self):
+        with mock.patch('HRMS.views.connection.ensure_connection', side_effect=OperationalError):
+            response = self.client.get('/readyz')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()['reason'], 'database unreachable')
+
+
+class ReleaseCommandTests(TestCase):
+    """The release-phase management command."""
+
+    def test_migrates_without_lock_on_other_backends(self):
+        out = StringIO()
+        with mock.patch('HRMS.management.commands.release.call_command') as call:
+            call_command('release', stdout=out)
+
+        call.assert_called_once_with('migrate', database='default', interactive=False, verbosity=1)
+        self.assertIn('No release lock support for sqlite', out.getvalue())
+        self.assertIn('Release finished', out.getvalue())
+
+    def test_mysql_lock_timeout(self):
+        connection = mock.MagicMock(vendor='mysql')
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = (0,)
+
+        with self.assertRaises(CommandError):
+            with ReleaseCommand().release_lock(connection, timeout=1):
+                self.fail("Block must not run without the lock")
+
+    def test_mysql_lock_released(self):
+        connection = mock.MagicMock(vendor='mysql')
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = (1,)
+
+        with ReleaseCommand().release_lock(connection, timeout=1):
+            pass
+        cursor.execute.assert_called_with("SELECT RELEASE_LOCK(%s)", ['hrms_lite_release'])
@@ -1,12 +1,17 @@
 from django.urls import path
 from .views import (
     DashboardView,
+    DashboardStreamView,
     EmployeeListView,
     EmployeeCreateView,
     EmployeeDeleteView,
     AttendanceListView,
     AttendanceCreateView,
     EmployeeAttendanceView,
+    UnmarkedEmployeesView,
+    ProfileListView,
+    ProfileDetailView,
+    profile_folded_stacks,
 )
 
 app_name = 'hrms'
@@ -14,6 +19,7 @@ app_name = 'hrms'
 urlpatterns = [
     # Dashboard
     path('', DashboardView.as_view(), name='dashboard'),
+    path('dashboard/stream/', DashboardStreamView.as_view(), name='dashboard_stream'),
     
     # Employee URLs
     path('employees/', EmployeeListView.as_view(), name='employee_list'),
@@ -24,4 +30,10 @@ urlpatterns = [
     # Attendance URLs
     path('attendance/', AttendanceListView.as_view(), name='attendance_list'),
     path('attendance/add/', AttendanceCreateView.as_view(), name='attendance_add'),
+    path('attendance/unmarked/', UnmarkedEmployeesView.as_view(), name='attendance_unmarked'),
+    
+    # Profiling URLs (staff only)
+    path('profiles/', ProfileListView.as_view(), name='profile_list'),
+    path('profiles/<int:pk>/', ProfileDetailView.as_view(), name='profile_detail'),
+    path('profiles/<int:pk>/folded/', profile_folded_stacks, name='profile_folded'),
 ]
\ No newline at end of file
@@ -3,49 +3,59 @@ from django.views.generic import (
     TemplateView, ListView, CreateView, DeleteView, DetailView
 )
 from django.urls import reverse_lazy
-from django.http import JsonResponse
-from django.db.models import Count, Q
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.contrib.admin.views.decorators import staff_member_required
+from django.utils.decorators import method_decorator
+from django.db import DatabaseError, connection
+from django.db.migrations.executor import MigrationExecutor
+from django.db.models import Avg, Count, Max, Q
 from django.utils import timezone
-from datetime import date, timedelta
-from .models import Employee, Attendance
+from django.views import View
+import hashlib
+import json
+import time
+from datetime import date
+from django.utils.dateparse import parse_date
+from .models import Department, Employee, Attendance, RequestProfile
 from .forms import EmployeeForm, AttendanceForm, AttendanceFilterForm
+from .dashboard import feed, get_dashboard_stats
+
+
+def fragment_version(*parts):
+    """Short digest of the values a cached template fragment depends on."""
+    return hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+
+
+def employee_rows_version(employees):
+    """Cache version for a page of employee rows (see employee_list.html)."""
+    return fragment_version([
+        (employee.pk, employee.updated_at, employee.department_id,
+         employee.department.updated_at if employee.department else None)
+        for employee in employees
+    ])
+
+
+def attendance_rows_version(records):
+    """Cache version for a page of attendance rows (see attendance_list.html)."""
+    return fragment_version([
+        (record.pk, record.status, record.date, record.employee.updated_at)
+        for record in records
+    ])
 
 
 class DashboardView(TemplateView):
     """Dashboard view with summary statistics."""
+    use_read_replica = True
     template_name = 'dashboard.html'
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        today = date.today()
-        
-        # Employee statistics
-        context['total_employees'] = Employee.objects.count()
         
-        # Today's attendance
-        today_attendance = Attendance.objects.filter(date=today)
-        context['today_present'] = today_attendance.filter(status='present').count()
-        context['today_absent'] = today_attendance.filter(status='absent').count()
-        context['today_total'] = today_attendance.count()
-        
-        # Calculate attendance rate for today
-        if context['total_employees'] > 0:
-            context['attendance_rate'] = round(
-                (context['today_present'] / context['total_employees']) * 100, 1
-            )
-        else:
-            context['attendance_rate'] = 0
-        
-        # This week's attendance summary
-        week_start = today - timedelta(days=today.weekday())
-        week_attendance = Attendance.objects.filter(
-            date__gte=week_start, date__lte=today
-        )
-        context['week_present'] = week_attendance.filter(status='present').count()
-        context['week_absent'] = week_attendance.filter(status='absent').count()
+        # Employee and attendance statistics
+        context.update(get_dashboard_stats())
         
         # Recent employees (last 5 added)
-        context['recent_employees'] = Employee.objects.order_by('-created_at')[:5]
+        context['recent_employees'] = Employee.objects.select_related('department').order_by('-created_at')[:5]
         
         # Recent attendance records (last 10)
         context['recent_attendance'] = Attendance.objects.select_related('employee').order_by('-date', '-created_at')[:10]
@@ -53,29 +63,103 @@ class DashboardView(TemplateView):
         return context
 
 
+class FeedStreamingResponse(StreamingHttpResponse):
+    """Streaming response that releases its dashboard feed slot on close.
+
+    The server calls close() even when the client disconnects before the
+    first event is sent, when the generator itself never runs.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._subscribed = True
+    
+    def close(self):
+        try:
+            super().close()
+        finally:
+            if self._subscribed:
+                self._subscribed = False
+                feed.unsubscribe()
+
+
+class DashboardStreamView(View):
+    """Server-sent events stream of dashboard statistic changes."""
+    keepalive_interval = 15
+    max_duration = 300
+    busy_retry = 60
+    
+    def get(self, request, *args, **kwargs):
+        # Every open stream holds a worker thread; past the per-process limit
+        # turn clients away so ordinary pages always have threads to run on.
+        if not feed.subscribe():
+            response = HttpResponse(
+                f'retry: {self.busy_retry * 1000}\n\n',
+                content_type='text/event-stream',
+                status=503,
+            )
+            response['Retry-After'] = str(self.busy_retry)
+            response['Cache-Control'] = 'no-cache'
+            return response
+        
+        response = FeedStreamingResponse(
+            self.event_stream(), content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+    
+    def event_stream(self):
+        """Yield events for a client already registered with ``feed``."""
+        # Browsers reconnect automatically when the stream ends, which
+        # keeps a long-lived dashboard from pinning one worker thread.
+        yield 'retry: 3000\n\n'
+        version, stats = feed.snapshot(timeout=self.keepalive_interval)
+        if stats is not None:
+            yield self.format_event({'stats': stats, 'attendance': []})
+        
+        deadline = time.monotonic() + self.max_duration
+        while time.monotonic() < deadline:
+            version, payloads = feed.wait(version, timeout=self.keepalive_interval)
+            if not payloads:
+                yield ': keepalive\n\n'
+            for payload in payloads:
+                yield self.format_event(payload)
+    
+    def format_event(self, payload):
+        return f'event: dashboard\ndata: {json.dumps(payload)}\n\n'
+
+
 class EmployeeListView(ListView):
     """List all employees."""
+    use_read_replica = True
     model = Employee
     template_name = 'employees/employee_list.html'
     context_object_name = 'employees'
     paginate_by = 20
     
     def get_queryset(self):
-        queryset = super().get_queryset()
+        queryset = super().get_queryset().select_related('department')
         search = self.request.GET.get('search', '').strip()
+        department = self.request.GET.get('department', '')
         if search:
             queryset = queryset.filter(
                 Q(employee_id__icontains=search) |
                 Q(full_name__icontains=search) |
                 Q(email__icontains=search) |
-                Q(department__icontains=search)
+                Q(department__name__icontains=search)
             )
+        if department.isdigit():
+            queryset = queryset.filter(department_id=department)
         return queryset
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['search'] = self.request.GET.get('search', '')
+        context['department'] = self.request.GET.get('department', '')
+        context['departments'] = Department.objects.order_by('name')
         context['total_count'] = Employee.objects.count()
+        context['rows_cache_version'] = employee_rows_version(context['employees'])
         return context
 
 
@@ -138,6 +222,7 @@ class EmployeeDeleteView(DeleteView):
 
 class AttendanceListView(ListView):
     """List all attendance records with filtering."""
+    use_read_replica = True
     model = Attendance
     template_name = 'attendance/attendance_list.html'
     context_object_name = 'attendance_records'
@@ -147,11 +232,14 @@ class AttendanceListView(ListView):
         queryset = super().get_queryset().select_related('employee')
         
         # Apply filters
+        department = self.request.GET.get('department', '')
         employee_id = self.request.GET.get('employee', '')
         date_from = self.request.GET.get('date_from', '')
         date_to = self.request.GET.get('date_to', '')
         status = self.request.GET.get('status', '')
         
+        if department.isdigit():
+            queryset = queryset.filter(employee__department_id=department)
         if employee_id:
             queryset = queryset.filter(employee_id=employee_id)
         if date_from:
@@ -159,19 +247,24 @@ class AttendanceListView(ListView):
         if date_to:
             queryset = queryset.filter(date__lte=date_to)
         if status:
-            queryset = queryset.filter(status=status)
+            # Filter values stay the public codes ('present'/'absent')
+            status_value = Attendance.Status.from_code(status)
+            if status_value is None:
+                return queryset.none()
+            queryset = queryset.filter(status=status_value)
         
         return queryset
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['filter_form'] = AttendanceFilterForm(self.request.GET)
+        context['rows_cache_version'] = attendance_rows_version(context['attendance_records'])
         context['total_count'] = self.get_queryset().count()
         
         # Summary stats
         queryset = self.get_queryset()
-        context['present_count'] = queryset.filter(status='present').count()
-        context['absent_count'] = queryset.filter(status='absent').count()
+        context['present_count'] = queryset.filter(status=Attendance.Status.PRESENT).count()
+        context['absent_count'] = queryset.filter(status=Attendance.Status.ABSENT).count()
         
         return context
 
@@ -192,7 +285,18 @@ class AttendanceCreateView(CreateView):
     def get_initial(self):
         initial = super().get_initial()
         initial['date'] = date.today()
-        initial['status'] = 'present'
+        initial['status'] = Attendance.Status.PRESENT.code
+        
+        # Allow prefilling from links such as the unmarked employees page
+        employee_id = self.request.GET.get('employee', '')
+        if employee_id.isdigit():
+            initial['employee'] = employee_id
+        try:
+            requested_date = parse_date(self.request.GET.get('date', ''))
+        except ValueError:
+            requested_date = None
+        if requested_date:
+            initial['date'] = requested_date
         return initial
     
     def form_valid(self, form):
@@ -214,8 +318,41 @@ class AttendanceCreateView(CreateView):
         return super().form_invalid(form)
 
 
+class UnmarkedEmployeesView(ListView):
+    """List employees with no attendance record for a given date."""
+    use_read_replica = True
+    model = Employee
+    template_name = 'attendance/unmarked_list.html'
+    context_object_name = 'employees'
+    paginate_by = 25
+    
+    def get_date(self):
+        try:
+            selected_date = parse_date(self.request.GET.get('date', ''))
+        except ValueError:
+            selected_date = None
+        # Same default day as mark_absent, in TIME_ZONE rather than server time
+        return selected_date or timezone.localdate()
+    
+    def get_queryset(self):
+        queryset = Employee.objects.unmarked_on(self.get_date()).select_related('department')
+        department = self.request.GET.get('department', '')
+        if department.isdigit():
+            queryset = queryset.filter(department_id=department)
+        return queryset
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['selected_date'] = self.get_date()
+        context['department'] = self.request.GET.get('department', '')
+        context['departments'] = Department.objects.order_by('name')
+        context['unmarked_count'] = context['paginator'].count
+        return context
+
+
 class EmployeeAttendanceView(DetailView):
     """View attendance records for a specific employee."""
+    use_read_replica = True
     model = Employee
     template_name = 'attendance/employee_attendance.html'
     context_object_name = 'employee'
@@ -239,8 +376,8 @@ class EmployeeAttendanceView(DetailView):
         
         context['attendance_records'] = attendance_records
         context['total_records'] = attendance_records.count()
-        context['present_days'] = attendance_records.filter(status='present').count()
-        context['absent_days'] = attendance_records.filter(status='absent').count()
+        context['present_days'] = attendance_records.filter(status=Attendance.Status.PRESENT).count()
+        context['absent_days'] = attendance_records.filter(status=Attendance.Status.ABSENT).count()
         
         # Calculate attendance percentage
         if context['total_records'] > 0:
@@ -256,6 +393,87 @@ class EmployeeAttendanceView(DetailView):
         return context
 
 
+@method_decorator(staff_member_required, name='dispatch')
+class ProfileListView(ListView):
+    """Recent request profiles with a per-route summary (staff only)."""
+    model = RequestProfile
+    template_name = 'profiling/profile_list.html'
+    context_object_name = 'profiles'
+    paginate_by = 25
+    
+    def get_queryset(self):
+        queryset = super().get_queryset().defer(
+            'top_functions', 'top_allocations', 'folded_stacks'
+        )
+        route = self.request.GET.get('route', '')
+        if route:
+            queryset = queryset.filter(route=route)
+        return queryset
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['route'] = self.request.GET.get('route', '')
+        context['routes'] = (
+            RequestProfile.objects.values('route')
+            .annotate(
+                count=Count('pk'),
+                avg_duration=Avg('duration_ms'),
+                max_duration=Max('duration_ms'),
+                avg_sql=Avg('sql_ms'),
+                avg_template=Avg('template_ms'),
+                max_peak_memory=Max('peak_memory'),
+            )
+            .order_by('-max_duration')
+        )
+        return context
+
+
+@method_decorator(staff_member_required, name='dispatch')
+class ProfileDetailView(DetailView):
+    """Top functions and allocations for one profiled request (staff only)."""
+    model = RequestProfile
+    template_name = 'profiling/profile_detail.html'
+    context_object_name = 'profile'
+
+
+@staff_member_required
+def profile_folded_stacks(request, pk):
+    """Download a profile's folded stacks for flame graph tools."""
+    profile = get_object_or_404(RequestProfile, pk=pk)
+    response = HttpResponse(profile.folded_stacks, content_type='text/plain; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="profile-{profile.pk}.folded"'
+    return response
+
+
+# Health checks
+_migrations_applied = False
+
+
+def healthz(request):
+    """Liveness probe: the process is up and serving requests."""
+    return JsonResponse({'status': 'ok'})
+
+
+def readyz(request):
+    """Readiness probe: the database is reachable and fully migrated."""
+    global _migrations_applied
+    
+    try:
+        connection.ensure_connection()
+        if not _migrations_applied:
+            # Loading the migration graph is comparatively slow, so it is only
+            # checked until the first time everything is applied.
+            executor = MigrationExecutor(connection)
+            targets = executor.loader.graph.leaf_nodes()
+            if executor.migration_plan(targets):
+                return JsonResponse({'status': 'unavailable', 'reason': 'pending migrations'}, status=503)
+            _migrations_applied = True
+    except DatabaseError:
+        return JsonResponse({'status': 'unavailable', 'reason': 'database unreachable'}, status=503)
+    
+    return JsonResponse({'status': 'ok'})
+
+
 # Error handlers
 def custom_404(request, exception):
     """Custom 404 error handler."""